@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import shutil
 import subprocess
 import sys
 import venv
@@ -12,11 +15,12 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 VENV_DIR = PROJECT_ROOT / ".venv"
 DEPTH_PRO_DIR = PROJECT_ROOT / "third_party" / "ml-depth-pro"
+STAMP_FILE = VENV_DIR / ".installed_hashes.json"
 
 
-def run(cmd: list[str], *, cwd: Path | None = None) -> None:
+def run(cmd: list[str], *, cwd: Path | None = None, env: dict[str, str] | None = None) -> None:
     print("::", " ".join(cmd))
-    subprocess.check_call(cmd, cwd=str(cwd) if cwd else None)
+    subprocess.check_call(cmd, cwd=str(cwd) if cwd else None, env=env)
 
 
 def ensure_submodules() -> None:
@@ -48,8 +52,34 @@ def ensure_submodules() -> None:
         )
 
 
+def _load_stamps() -> dict[str, str]:
+    if STAMP_FILE.exists():
+        try:
+            return json.loads(STAMP_FILE.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+    return {}
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _install_needed(stamps: dict[str, str], key: str, path: Path) -> bool:
+    if stamps.get(key) == _file_hash(path):
+        print(f":: {path.name} unchanged since last install; skipping")
+        return False
+    return True
+
+
+def _record_install(stamps: dict[str, str], key: str, path: Path) -> None:
+    stamps[key] = _file_hash(path)
+    STAMP_FILE.write_text(json.dumps(stamps, indent=2))
+
+
 def ensure_venv() -> Path:
-    if not VENV_DIR.exists():
+    fresh_venv = not VENV_DIR.exists()
+    if fresh_venv:
         print(":: Creating virtual environment at", VENV_DIR)
         venv.create(VENV_DIR, with_pip=True)
     else:
@@ -58,17 +88,53 @@ def ensure_venv() -> Path:
     python_path = VENV_DIR / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
     if not python_path.exists():
         raise RuntimeError("Virtual environment python binary not found")
-    run([str(python_path), "-m", "pip", "install", "--upgrade", "pip"])
-    run([str(python_path), "-m", "pip", "install", "-r", "requirements.txt"], cwd=PROJECT_ROOT)
+    if fresh_venv:
+        # setuptools/wheel are needed because installs run with
+        # --no-build-isolation, and venvs on Python >= 3.12 ship pip only.
+        run([str(python_path), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"])
+
+    stamps = _load_stamps()
+    install_args: list[str] = []
+    to_record: list[tuple[str, Path]] = []
+
+    requirements = PROJECT_ROOT / "requirements.txt"
+    if _install_needed(stamps, "requirements", requirements):
+        install_args += ["-r", str(requirements)]
+        to_record.append(("requirements", requirements))
 
     depth_requirements = DEPTH_PRO_DIR / "requirements.txt"
     if depth_requirements.exists():
-        run([str(python_path), "-m", "pip", "install", "-r", str(depth_requirements)])
+        if _install_needed(stamps, "depth-pro-requirements", depth_requirements):
+            install_args += ["-r", str(depth_requirements)]
+            to_record.append(("depth-pro-requirements", depth_requirements))
     else:
         print(":: Depth Pro requirements file not found; skipping optional install")
 
-    print(":: Installing Depth Pro package (editable)")
-    run([str(python_path), "-m", "pip", "install", "-e", str(DEPTH_PRO_DIR)])
+    depth_metadata = next(
+        (p for p in (DEPTH_PRO_DIR / "pyproject.toml", DEPTH_PRO_DIR / "setup.py") if p.exists()),
+        None,
+    )
+    if depth_metadata is None or _install_needed(stamps, "depth-pro-editable", depth_metadata):
+        install_args += ["-e", str(DEPTH_PRO_DIR)]
+        if depth_metadata is not None:
+            to_record.append(("depth-pro-editable", depth_metadata))
+
+    if install_args:
+        # One resolver pass over everything instead of three pip invocations,
+        # with a persistent wheel cache shared across bootstraps.
+        env = os.environ.copy()
+        env.setdefault("PIP_CACHE_DIR", str(PROJECT_ROOT / ".pipcache"))
+        uv = shutil.which("uv")
+        if uv:
+            cmd = [uv, "pip", "install", "--python", str(python_path), *install_args]
+        else:
+            cmd = [
+                str(python_path), "-m", "pip", "install",
+                "--prefer-binary", "--no-build-isolation", *install_args,
+            ]
+        run(cmd, cwd=PROJECT_ROOT, env=env)
+        for key, path in to_record:
+            _record_install(stamps, key, path)
 
     return python_path
 
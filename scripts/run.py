@@ -3,11 +3,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import signal
-import subprocess
 import sys
-import time
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -17,7 +15,7 @@ def _python() -> str:
     return sys.executable
 
 
-def launch_backend() -> subprocess.Popen:
+async def launch_backend() -> asyncio.subprocess.Process:
     host = os.environ.get("RGBDE_BACKEND_HOST", "0.0.0.0")
     port = os.environ.get("RGBDE_BACKEND_PORT", "8000")
     cmd = [
@@ -29,56 +27,68 @@ def launch_backend() -> subprocess.Popen:
         host,
         "--port",
         port,
-        "--reload",
     ]
+    if os.environ.get("RGBDE_DEV") == "1":
+        # Auto-reload disables several uvicorn optimisations; opt in for dev.
+        cmd.append("--reload")
+    else:
+        cmd += ["--workers", os.environ.get("RGBDE_WORKERS", "1")]
+        if os.name != "nt":
+            cmd += ["--loop", "uvloop", "--http", "httptools"]
     print("::", " ".join(cmd))
-    return subprocess.Popen(cmd, cwd=PROJECT_ROOT)
+    return await asyncio.create_subprocess_exec(*cmd, cwd=PROJECT_ROOT)
 
 
-def launch_frontend() -> subprocess.Popen:
+async def launch_frontend() -> asyncio.subprocess.Process:
     port = os.environ.get("RGBDE_FRONTEND_PORT", "5173")
     env = os.environ.copy()
     env.setdefault("RGBDE_FRONTEND_PORT", port)
     cmd = [_python(), "scripts/run_frontend.py"]
     print("::", " ".join(cmd))
-    return subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env)
+    return await asyncio.create_subprocess_exec(*cmd, cwd=PROJECT_ROOT, env=env)
 
 
-def monitor(processes: list[tuple[str, subprocess.Popen]]) -> None:
+async def monitor(processes: list[tuple[str, asyncio.subprocess.Process]]) -> None:
+    """Block on child exits instead of polling them on a timer."""
+    waiters = {
+        asyncio.create_task(proc.wait()): name for name, proc in processes
+    }
     try:
-        while True:
-            for name, proc in processes:
-                ret = proc.poll()
-                if ret is not None:
-                    raise RuntimeError(f"{name} exited with code {ret}")
-            time.sleep(0.8)
-    except KeyboardInterrupt:
-        print("\n:: Keyboard interrupt received, shutting down...")
-    except RuntimeError as exc:
-        print(f":: {exc}")
+        done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            print(f":: {waiters[task]} exited with code {task.result()}")
     finally:
         for name, proc in processes:
-            if proc.poll() is None:
+            if proc.returncode is None:
                 try:
-                    proc.send_signal(signal.SIGTERM)
-                except Exception:
+                    proc.terminate()
+                except ProcessLookupError:
                     pass
         for name, proc in processes:
             try:
-                proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
                 try:
                     proc.kill()
-                except Exception:
+                except ProcessLookupError:
                     pass
 
 
-def main() -> None:
-    backend = launch_backend()
-    frontend = launch_frontend()
+async def amain() -> None:
+    backend = await launch_backend()
+    frontend = await launch_frontend()
     print(":: Backend -> http://localhost:%s" % os.environ.get("RGBDE_BACKEND_PORT", "8000"))
     print(":: Frontend -> http://localhost:%s" % os.environ.get("RGBDE_FRONTEND_PORT", "5173"))
-    monitor([("backend", backend), ("frontend", frontend)])
+    await monitor([("backend", backend), ("frontend", frontend)])
+
+
+def main() -> None:
+    try:
+        asyncio.run(amain())
+    except KeyboardInterrupt:
+        print("\n:: Keyboard interrupt received, shutting down...")
 
 
 if __name__ == "__main__":
@@ -21,7 +21,13 @@ def venv_python() -> Path:
 
 def main() -> None:
     python_bin = venv_python()
-    cmd = [str(python_bin), "-m", "uvicorn", "server.main:app", "--host", os.environ.get("RGBDE_BACKEND_HOST", "0.0.0.0"), "--port", os.environ.get("RGBDE_BACKEND_PORT", "8000"), "--reload"]
+    cmd = [str(python_bin), "-m", "uvicorn", "server.main:app", "--host", os.environ.get("RGBDE_BACKEND_HOST", "0.0.0.0"), "--port", os.environ.get("RGBDE_BACKEND_PORT", "8000")]
+    if os.environ.get("RGBDE_DEV") == "1":
+        cmd.append("--reload")
+    else:
+        cmd += ["--workers", os.environ.get("RGBDE_WORKERS", "1")]
+        if os.name != "nt":
+            cmd += ["--loop", "uvloop", "--http", "httptools"]
     print("::", " ".join(cmd))
     subprocess.check_call(cmd, cwd=str(PROJECT_ROOT))
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import http.server
 import os
-import socketserver
+from http import HTTPStatus
 from pathlib import Path
 
 DEFAULT_PORT = int(os.environ.get("RGBDE_FRONTEND_PORT", "5173"))
@@ -16,12 +16,49 @@ class QuietHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def log_message(self, format: str, *args) -> None:  # noqa: A003 - matches base signature
         pass
 
+    def send_head(self):
+        path = self.translate_path(self.path)
+        self._etag = None
+        if os.path.isfile(path):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return super().send_head()
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return None
+            self._etag = etag
+        return super().send_head()
+
+    def end_headers(self) -> None:
+        if getattr(self, "_etag", None):
+            # Revalidate on every load; unchanged assets answer with 304.
+            self.send_header("ETag", self._etag)
+            self.send_header("Cache-Control", "no-cache")
+            self._etag = None
+        super().end_headers()
+
+    def copyfile(self, source, outputfile) -> None:
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            # Directory listings come from BytesIO; stream those the old way.
+            super().copyfile(source, outputfile)
+            return
+        # Hand the file descriptor to the kernel instead of shuttling chunks
+        # through Python; socket.sendfile uses sendfile(2) where available.
+        self.wfile.flush()
+        self.connection.sendfile(source)
+
 
 def main() -> None:
     os.chdir(WEBAPP_DIR)
-    handler = QuietHTTPRequestHandler
-    socketserver.TCPServer.allow_reuse_address = True
-    with socketserver.TCPServer(("0.0.0.0", DEFAULT_PORT), handler) as httpd:
+    http.server.ThreadingHTTPServer.allow_reuse_address = True
+    server = http.server.ThreadingHTTPServer(("0.0.0.0", DEFAULT_PORT), QuietHTTPRequestHandler)
+    with server as httpd:
         print(f"Serving {WEBAPP_DIR} at http://localhost:{DEFAULT_PORT}")
         try:
             httpd.serve_forever()
@@ -4,63 +4,155 @@ import asyncio
 import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from shutil import copy2
-from tempfile import TemporaryDirectory
-from typing import Tuple
+from typing import AsyncIterator, Tuple
 
 import numpy as np
-from PIL import Image
+from PIL import Image, ImageOps
 
-# Ensure the Depth Pro submodule is importable before pulling in torch/depth_pro.
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SUBMODULE_PATH = PROJECT_ROOT / "third_party" / "ml-depth-pro"
-if SUBMODULE_PATH.exists() and str(SUBMODULE_PATH) not in sys.path:
-    sys.path.insert(0, str(SUBMODULE_PATH))
-
-try:  # pragma: no cover - import guard for clearer error messaging
-  import torch  # noqa: E402
-except ImportError as exc:  # pragma: no cover
-  raise RuntimeError(
-    'PyTorch is required. Run scripts/bootstrap.py and install a torch build for your '
-    'platform (e.g. `pip install torch --index-url https://download.pytorch.org/whl/cpu`).'
-  ) from exc
-
-try:  # pragma: no cover - import guard
-  import depth_pro  # noqa: E402
-except ImportError as exc:  # pragma: no cover
-  raise RuntimeError(
-    'depth_pro package not found. Ensure the ml-depth-pro sources are available '
-    '(git submodule update --init --recursive or clone the repository into '
-    'third_party/ml-depth-pro).'
-  ) from exc
-
-DepthProConfig = getattr(depth_pro, "DepthProConfig", None)
-
-try:  # pragma: no cover - optional dependency installed with depth_pro
-  from huggingface_hub import hf_hub_download
+
+# torch/depth_pro are imported lazily via _load_backends so that importing
+# this module (e.g. for /api/status or a uvicorn --reload cycle) stays cheap.
+torch = None
+depth_pro = None
+DepthProConfig = None
+hf_hub_download = None
+
+
+def _load_backends() -> None:
+    """Import torch and depth_pro on first use.
+
+    Pulling in torch loads CUDA libraries and spawns worker threads, which
+    costs whole seconds on a cold start; deferring it keeps module import
+    fast while production still pays the cost once via the startup preload.
+    """
+    global torch, depth_pro, DepthProConfig, hf_hub_download
+    if torch is not None:
+        return
+
+    # Cap intra-op threads before torch initialises its pools; the defaults
+    # oversubscribe the host once the worker pools are added on top.
+    half_cores = str(max(1, (os.cpu_count() or 2) // 2))
+    os.environ.setdefault("OMP_NUM_THREADS", half_cores)
+    os.environ.setdefault("MKL_NUM_THREADS", half_cores)
+
+    # huggingface_hub latches this flag at import time, and depth_pro pulls
+    # the hub in transitively via timm, so it must be set before the torch
+    # and depth_pro imports below.
+    try:  # pragma: no cover - optional Rust downloader with parallel ranges
+        import hf_transfer  # noqa: F401
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    except ImportError:  # pragma: no cover
+        pass
+
+    # Ensure the Depth Pro submodule is importable before pulling in depth_pro.
+    if SUBMODULE_PATH.exists() and str(SUBMODULE_PATH) not in sys.path:
+        sys.path.insert(0, str(SUBMODULE_PATH))
+
+    try:
+        import torch as _torch
+    except ImportError as exc:
+        raise RuntimeError(
+            'PyTorch is required. Run scripts/bootstrap.py and install a torch build for your '
+            'platform (e.g. `pip install torch --index-url https://download.pytorch.org/whl/cpu`).'
+        ) from exc
+
+    try:
+        import depth_pro as _depth_pro
+    except ImportError as exc:
+        raise RuntimeError(
+            'depth_pro package not found. Ensure the ml-depth-pro sources are available '
+            '(git submodule update --init --recursive or clone the repository into '
+            'third_party/ml-depth-pro).'
+        ) from exc
+
+    try:  # pragma: no cover - optional dependency installed with depth_pro
+        from huggingface_hub import hf_hub_download as _hf_hub_download
+    except ImportError:  # pragma: no cover
+        _hf_hub_download = None
+
+    _torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+
+    torch = _torch
+    depth_pro = _depth_pro
+    DepthProConfig = getattr(_depth_pro, "DepthProConfig", None)
+    hf_hub_download = _hf_hub_download
+
+try:  # pragma: no cover - optional SIMD-accelerated PNG codec
+  # The pyspng-seunglab distribution provides the pyspng module with an
+  # encoder; upstream pyspng releases are decode-only.
+  import pyspng
+except ImportError:  # pragma: no cover
+  pyspng = None
+if pyspng is not None and not hasattr(pyspng, "encode"):  # pragma: no cover
+  # Decode-only upstream pyspng is installed; fall back to Pillow.
+  pyspng = None
+
+try:  # pragma: no cover - optional libjpeg-turbo binding
+  from turbojpeg import TJPF_RGB, TurboJPEG
 except ImportError:  # pragma: no cover
-  hf_hub_download = None
+  TurboJPEG = None
+  TJPF_RGB = None
 
 
 @dataclass
 class DepthResult:
-    """Container for generated RGBDE payload."""
+    """Container for generated RGBDE payload, streamed as it is encoded."""
 
-    png_bytes: bytes
+    png_iter: AsyncIterator[bytes]
     filename: str
 
 
+# Process-wide pool for decode/compose/encode work, kept separate from the
+# loop's default executor so request CPU stages never contend with uvicorn's
+# own blocking callbacks.
+_WORKER_POOL = ThreadPoolExecutor(thread_name_prefix="rgbde-worker")
+
+
+class _QueueWriter(io.RawIOBase):
+    """File-like bridge forwarding encoder writes from a worker thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: "asyncio.Queue[bytes | None]") -> None:
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, chunk) -> int:
+        data = bytes(chunk)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, data)
+        return len(data)
+
+
+@dataclass
+class _PendingInference:
+    """A queued forward pass awaiting the batching worker."""
+
+    tensor: "torch.Tensor"
+    focal_px: float | None
+    future: "asyncio.Future[torch.Tensor]"
+
+
 class DepthProService:
     """Wraps Apple Depth Pro inference for RGBDE generation."""
 
     def __init__(self) -> None:
+        _load_backends()
         device_name = os.environ.get("DEPTH_DEVICE")
         if device_name:
             self.device = torch.device(device_name)
         else:
             self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.device_label = str(self.device)
         checkpoint_path = ensure_checkpoint()
         if DepthProConfig is not None:
             try:
@@ -72,6 +164,68 @@ class DepthProService:
             self.model, self.transform = self._load_without_config(checkpoint_path)
         self.model = self.model.to(self.device)
         self.model.eval()
+        if self.device.type == "cuda":
+            self.model = self.model.to(memory_format=torch.channels_last)
+            # Depth Pro always infers at its fixed internal resolution, so
+            # kernels autotuned on the warmup pass stay valid for every
+            # subsequent request.
+            torch.backends.cudnn.benchmark = True
+        self._autocast_dtype = self._resolve_autocast_dtype()
+        self._compiled = False
+        self._max_batch = max(1, int(os.environ.get("RGBDE_MAX_BATCH", "4")))
+        self._batch_window = max(0.0, float(os.environ.get("RGBDE_BATCH_WINDOW_MS", "5"))) / 1000.0
+        self._queue: asyncio.Queue[_PendingInference] | None = None
+        self._batch_task: asyncio.Task[None] | None = None
+        # Single worker so one thread owns the device context for every
+        # forward pass; callers queue deterministically behind it.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="depthpro")
+        if os.environ.get("RGBDE_COMPILE", "1") != "0":
+            os.environ.setdefault(
+                "TORCHINDUCTOR_CACHE_DIR", str(CHECKPOINT_DIR / "torchinductor")
+            )
+            # reduce-overhead is inductor's CUDA graph replay path: the fixed
+            # internal shape is captured once at warmup and replayed per
+            # request, collapsing thousands of kernel launches into one.
+            # max-autotune additionally searches kernel configurations.
+            mode = os.environ.get("RGBDE_COMPILE_MODE", "reduce-overhead")
+            try:
+                # Compile forward rather than wrapping the module: infer()
+                # never goes through OptimizedModule.__call__, but it does
+                # invoke self.forward, which this rebinds to the compiled
+                # callable.
+                self.model.forward = torch.compile(self.model.forward, mode=mode, dynamic=True)
+                self._compiled = True
+            except Exception as exc:  # pragma: no cover - platform-dependent support
+                print(":: torch.compile unavailable, running eager:", exc)
+
+    def warmup(self) -> None:
+        """Run one dummy inference so compile latency is paid at startup.
+
+        Only needed when torch.compile is active; the first real request
+        would otherwise absorb the full kernel-generation cost.
+        """
+        if not self._compiled:
+            return
+        dummy = torch.zeros(1, 3, 1536, 1536, device=self.device)
+        with torch.inference_mode(), self._inference_context():
+            self.model.infer(dummy, f_px=None)
+
+    def _resolve_autocast_dtype(self) -> "torch.dtype | None":
+        """Pick the autocast dtype from RGBDE_PRECISION (fp16|bf16|fp32)."""
+        precision = os.environ.get("RGBDE_PRECISION", "").lower()
+        if not precision:
+            precision = "fp16" if self.device.type == "cuda" else "bf16"
+        dtypes = {"fp16": torch.float16, "bf16": torch.bfloat16, "fp32": None}
+        if precision not in dtypes:
+            raise RuntimeError(
+                f"Unsupported RGBDE_PRECISION={precision!r}; expected fp16, bf16 or fp32."
+            )
+        return dtypes[precision]
+
+    def _inference_context(self):
+        if self._autocast_dtype is None:
+            return nullcontext()
+        return torch.autocast(device_type=self.device.type, dtype=self._autocast_dtype)
 
     def _load_without_config(self, checkpoint_path: Path):
         original_cwd = Path.cwd()
@@ -85,54 +239,273 @@ class DepthProService:
         finally:
             os.chdir(original_cwd)
 
-    @property
-    def device_label(self) -> str:
-        return str(self.device)
-
     async def generate_rgbde(self, data: bytes, original_name: str) -> DepthResult:
-        return await asyncio.to_thread(self._generate_rgbde_sync, data, original_name)
-
-    def _generate_rgbde_sync(self, data: bytes, original_name: str) -> DepthResult:
+        loop = asyncio.get_running_loop()
+        tensor, rgb_array, focal_px = await loop.run_in_executor(
+            _WORKER_POOL, partial(self._preprocess_sync, data, original_name)
+        )
+        depth_tensor = await self._infer_batched(tensor, focal_px)
+        combined = await loop.run_in_executor(
+            _WORKER_POOL, partial(self._compose_sync, depth_tensor, rgb_array)
+        )
+        output_name = f"{Path(original_name).stem}_RGBDE.png"
+        return DepthResult(png_iter=self._encode_png_stream(combined), filename=output_name)
+
+    def _preprocess_sync(
+        self, data: bytes, original_name: str
+    ) -> Tuple["torch.Tensor", np.ndarray, float | None]:
         suffix = Path(original_name).suffix.lower()
         if suffix not in {".jpg", ".jpeg", ".png"}:
             raise ValueError("Only JPG and PNG inputs are supported.")
 
-        with TemporaryDirectory(prefix="rgbde_") as temp_dir:
-            input_path = Path(temp_dir) / f"source{suffix if suffix else '.png'}"
-            input_path.write_bytes(data)
-
-            image_data, _, focal_px = depth_pro.load_rgb(str(input_path))
-            tensor = self.transform(image_data).unsqueeze(0).to(self.device)
-
-            with torch.no_grad():
-                prediction = self.model.infer(tensor, f_px=focal_px)
-
-            depth = prediction["depth"].squeeze().cpu().numpy()
-            depth = np.nan_to_num(depth, nan=0.0, posinf=0.0, neginf=0.0)
-            depth = np.maximum(depth, 0.0)
-
-            rgb_array = np.array(image_data, dtype=np.uint8)
-            if rgb_array.ndim == 3 and rgb_array.shape[2] == 3:
-                rgb_array = np.concatenate([rgb_array, np.full_like(rgb_array[..., :1], 255)], axis=2)
-            elif rgb_array.ndim == 2:
-                rgb_array = np.stack([rgb_array, rgb_array, rgb_array, np.full_like(rgb_array, 255)], axis=2)
-
-            depth_rgb = self._encode_depth(depth)
-            combined = np.concatenate([rgb_array, depth_rgb], axis=1)
+        image_data = None
+        focal_px: float | None = None
+        if suffix in {".jpg", ".jpeg"}:
+            image_data, focal_px = _decode_jpeg_turbo(data)
+        if image_data is None:
+            image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+            focal_px = _extract_exif_focal(image)
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            image_data = np.asarray(image)
+
+        tensor = self.transform(image_data).unsqueeze(0)
+        if self.device.type == "cuda":
+            # Staging through pinned memory lets the driver DMA the upload
+            # asynchronously instead of taking a pageable synchronous copy.
+            tensor = tensor.pin_memory().to(self.device, non_blocking=True)
+        else:
+            tensor = tensor.to(self.device)
+
+        rgb_array = np.ascontiguousarray(image_data, dtype=np.uint8)
+        return tensor, rgb_array, focal_px
+
+    def _compose_sync(self, depth_tensor: "torch.Tensor", rgb_array: np.ndarray) -> np.ndarray:
+        # Autocast can leave infer's post-processing in fp16/bf16; numpy has
+        # no bfloat16 and fp16 overflows at depth*10000, so normalise first.
+        depth_tensor = depth_tensor.squeeze().float()
+        height, width = rgb_array.shape[:2]
+        combined = np.empty((height, 2 * width, 4), dtype=np.uint8)
+        left = combined[:, :width, :]
+        left[..., :3] = rgb_array
+        left[..., 3] = 255
+        right = combined[:, width:, :]
+        if depth_tensor.device.type == "cpu":
+            self._encode_depth_into(depth_tensor.numpy(), right)
+        else:
+            right[...] = self._encode_depth_on_device(depth_tensor)
+        return combined
+
+    async def _encode_png_stream(self, combined: np.ndarray) -> AsyncIterator[bytes]:
+        """Yield PNG bytes as the encoder produces them.
+
+        The Pillow encoder writes through a queue bridged from the worker
+        thread, so the client starts receiving data mid-encode and no full
+        response copy is held beyond the encoder's own buffers. The pyspng
+        path encodes in one shot and yields its buffer without a copy.
+        """
+        loop = asyncio.get_running_loop()
+        if pyspng is not None:
+            yield await loop.run_in_executor(
+                _WORKER_POOL, partial(pyspng.encode, np.ascontiguousarray(combined))
+            )
+            return
+
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        writer = _QueueWriter(loop, queue)
+
+        def encode() -> None:
+            try:
+                Image.fromarray(combined, mode="RGBA").save(writer, format="PNG", compress_level=6)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
 
-            output = Image.fromarray(combined, mode="RGBA")
-            buffer = io.BytesIO()
-            output.save(buffer, format="PNG", compress_level=9)
-            buffer.seek(0)
+        task = loop.run_in_executor(_WORKER_POOL, encode)
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            await task
+
+    async def _infer_batched(
+        self, tensor: "torch.Tensor", focal_px: float | None
+    ) -> "torch.Tensor":
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_worker())
+        pending = _PendingInference(tensor=tensor, focal_px=focal_px, future=loop.create_future())
+        await self._queue.put(pending)
+        return await pending.future
+
+    async def _batch_worker(self) -> None:
+        """Coalesce concurrent requests into batched forward passes.
+
+        Waits up to the configured window after the first item so callers
+        arriving together share one model.infer call instead of queueing
+        behind each other serially.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._batch_window
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                outcomes = await loop.run_in_executor(self._executor, self._run_batch, batch)
+            except Exception as exc:  # pragma: no cover - keeps the worker alive
+                # A failed drain must still resolve its futures, or every
+                # later request would queue forever behind this one.
+                for item in batch:
+                    if not item.future.cancelled():
+                        item.future.set_exception(exc)
+                continue
+            for item, outcome in zip(batch, outcomes):
+                if item.future.cancelled():
+                    continue
+                if isinstance(outcome, Exception):
+                    item.future.set_exception(outcome)
+                else:
+                    item.future.set_result(outcome)
+
+    def _run_batch(self, batch: list[_PendingInference]) -> list[object]:
+        """Run queued items, stacking those that can share a forward pass.
+
+        Only tensors with identical shapes and focal lengths are stacked;
+        anything else falls back to a single-item pass within the same call.
+        """
+        outcomes: dict[int, object] = {}
+        groups: dict[tuple, list[int]] = {}
+        for index, item in enumerate(batch):
+            key = (tuple(item.tensor.shape), item.focal_px)
+            groups.setdefault(key, []).append(index)
+        for (_, focal_px), indices in groups.items():
+            stacked_done = False
+            if len(indices) > 1:
+                try:
+                    stacked = torch.cat([batch[i].tensor for i in indices], dim=0)
+                    with torch.inference_mode(), self._inference_context():
+                        prediction = self.model.infer(stacked, f_px=focal_px)
+                    depth = prediction["depth"]
+                    if depth.dim() >= 3 and depth.shape[0] == len(indices):
+                        for offset, i in enumerate(indices):
+                            outcomes[i] = depth[offset]
+                        stacked_done = True
+                except Exception:  # pragma: no cover - retried item by item below
+                    stacked_done = False
+            if not stacked_done:
+                # Run items separately. Callers must never share one output
+                # tensor: later stages mutate the depth buffer in place from
+                # concurrent worker threads.
+                for i in indices:
+                    try:
+                        with torch.inference_mode(), self._inference_context():
+                            prediction = self.model.infer(batch[i].tensor, f_px=focal_px)
+                        outcomes[i] = prediction["depth"]
+                    except Exception as exc:  # pragma: no cover - surfaced via futures
+                        outcomes[i] = exc
+        return [outcomes[i] for i in range(len(batch))]
 
-            output_name = f"{Path(original_name).stem}_RGBDE.png"
-            return DepthResult(png_bytes=buffer.read(), filename=output_name)
+    @staticmethod
+    def _encode_depth_into(depth: np.ndarray, out: np.ndarray) -> None:
+        """Sanitise and pack metric depth straight into an RGBA slice.
+
+        NaN/inf scrubbing, the non-negative clamp and the 0.1mm fixed-point
+        scaling run in place on a single float array, and the uint32 result
+        is written through a view of the destination with no staging copy.
+        """
+        scaled = np.nan_to_num(depth, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.multiply(scaled, 10000.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        # Largest float32 value below 2**32; saturate so the uint32 cast
+        # cannot wrap around.
+        np.clip(scaled, 0.0, 4294967040.0, out=scaled)
+        out.view("<u4")[..., 0] = scaled
 
     @staticmethod
-    def _encode_depth(depth: np.ndarray) -> np.ndarray:
-        scaled = np.round(depth * 10000.0).astype("<u4")
-        rgba = scaled.view(np.uint8).reshape(depth.shape + (4,))
-        return rgba
+    def _encode_depth_on_device(depth: "torch.Tensor") -> np.ndarray:
+        """Pack depth into RGBA bytes on the accelerator before moving to host.
+
+        Sanitising, scaling and byte extraction run as torch ops on the
+        device, so the only device-to-host copy is the final uint8 RGBA
+        buffer instead of a float32 depth map plus extra CPU passes.
+        """
+        sanitised = torch.nan_to_num(depth, nan=0.0, posinf=0.0, neginf=0.0)
+        scaled = sanitised.mul_(10000.0).round_().clamp_(0.0, 4294967040.0).to(torch.int64)
+        shifts = torch.arange(4, device=scaled.device) * 8
+        rgba = ((scaled.unsqueeze(-1) >> shifts) & 0xFF).to(torch.uint8)
+        if rgba.device.type == "cuda":
+            # Read back through pinned memory so the copy overlaps queued
+            # work; one synchronize fences it before the numpy view is used.
+            host = torch.empty(rgba.shape, dtype=torch.uint8, pin_memory=True)
+            host.copy_(rgba, non_blocking=True)
+            torch.cuda.synchronize()
+            return host.numpy()
+        return rgba.cpu().numpy()
+
+
+_turbo_jpeg: "TurboJPEG | None" = None
+_turbo_jpeg_failed = False
+
+
+def _get_turbo_jpeg() -> "TurboJPEG | None":
+    """Lazily instantiate TurboJPEG; None when the native library is absent."""
+    global _turbo_jpeg, _turbo_jpeg_failed
+    if _turbo_jpeg is None and not _turbo_jpeg_failed and TurboJPEG is not None:
+        try:
+            _turbo_jpeg = TurboJPEG()
+        except Exception:  # pragma: no cover - binding present but libturbojpeg missing
+            _turbo_jpeg_failed = True
+    return _turbo_jpeg
+
+
+def _decode_jpeg_turbo(data: bytes) -> Tuple[np.ndarray | None, float | None]:
+    """Decode a JPEG via libjpeg-turbo when available.
+
+    Returns (None, None) when the binding is missing or the image carries a
+    non-default EXIF orientation, which this fast path does not apply; the
+    caller then falls back to the Pillow route. The lazy Image.open reads
+    only the header, so EXIF extraction here costs no pixel decode.
+    """
+    decoder = _get_turbo_jpeg()
+    if decoder is None:
+        return None, None
+    header = Image.open(io.BytesIO(data))
+    if header.getexif().get(0x0112, 1) != 1:
+        return None, None
+    focal_px = _extract_exif_focal(header)
+    try:
+        return decoder.decode(data, pixel_format=TJPF_RGB), focal_px
+    except Exception:  # pragma: no cover - let Pillow surface decode errors
+        return None, None
+
+
+def _extract_exif_focal(image: Image.Image) -> "np.float64 | None":
+    """Derive focal length in pixels from EXIF, as depth_pro.load_rgb does.
+
+    Uses FocalLengthIn35mmFilm scaled by the image diagonal relative to the
+    35mm frame diagonal; returns None when the tag is absent. The value is
+    a numpy scalar to match load_rgb's return type - infer calls .squeeze()
+    on any focal it receives, which a builtin float lacks.
+    """
+    try:
+        exif = image.getexif()
+        f35 = exif.get(41989) or exif.get_ifd(0x8769).get(41989)
+    except Exception:  # pragma: no cover - malformed EXIF payloads
+        return None
+    if not f35:
+        return None
+    width, height = image.size
+    return np.float64(f35) * np.hypot(width, height) / np.hypot(36.0, 24.0)
 
 
 _service: DepthProService | None = None
@@ -151,6 +524,7 @@ CHECKPOINT_DIR = PROJECT_ROOT / "checkpoints"
 def ensure_checkpoint() -> Path:
   """Download the Depth Pro checkpoint from Hugging Face if missing."""
 
+  _load_backends()
   target = CHECKPOINT_DIR / CHECKPOINT_FILENAME
   if target.exists():
       return target
@@ -167,7 +541,6 @@ def ensure_checkpoint() -> Path:
       repo_id=CHECKPOINT_REPO,
       filename=CHECKPOINT_FILENAME,
       local_dir=str(CHECKPOINT_DIR),
-      local_dir_use_symlinks=False,
   )
   downloaded_path = Path(downloaded)
   if downloaded_path != target:
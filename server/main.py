@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import io
+import asyncio
 import logging
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 from urllib.parse import quote
@@ -30,18 +31,20 @@ app.add_middleware(
 @app.on_event("startup")
 async def preload_model() -> None:
     service = get_depth_service()
+    app.state.depth = service
+    await asyncio.to_thread(service.warmup)
     logger.info("Depth Pro model initialised on %s", service.device_label)
 
 
 @app.get("/api/status")
 async def status() -> JSONResponse:
-    service = get_depth_service()
+    service: DepthProService = app.state.depth
     return JSONResponse({"status": "ok", "device": service.device_label})
 
 
 @app.post("/api/process")
 async def process_image(image: Annotated[UploadFile, File(...)]) -> StreamingResponse:
-    service: DepthProService = get_depth_service()
+    service: DepthProService = app.state.depth
     content = await image.read()
     if not content:
         raise HTTPException(status_code=400, detail="No image payload received.")
@@ -54,9 +57,8 @@ async def process_image(image: Annotated[UploadFile, File(...)]) -> StreamingRes
         logger.exception("Depth generation failed")
         raise HTTPException(status_code=500, detail="Depth generation failed.") from exc
 
-    stream = io.BytesIO(result.png_bytes)
     headers = build_download_headers(result.filename)
-    return StreamingResponse(stream, media_type="image/png", headers=headers)
+    return StreamingResponse(result.png_iter, media_type="image/png", headers=headers)
 
 
 def build_download_headers(filename: str) -> dict[str, str]:
@@ -74,6 +76,7 @@ def build_download_headers(filename: str) -> dict[str, str]:
     return headers
 
 
+@lru_cache(maxsize=256)
 def ascii_safe_filename(name: str) -> str:
     normalized = unicodedata.normalize('NFKD', name or '')
     ascii_name = normalized.encode('ascii', 'ignore').decode('ascii', 'ignore')